@@ -37,6 +37,7 @@ class ReactionCalculator:
     1) Variable management\n
     - substance(sub: str|Particle) -> LinearIterator\n
     - assume(*assumptions: str) -> None\n
+    - reload_assumptions() -> None\n
     - write(*data: SSDatum) -> None\n
     - erase(substance: str|Particle, variable: str) -> None\n
     - assume_excess(*substances: str|Particle) -> None\n
@@ -66,6 +67,7 @@ class ReactionCalculator:
     """
 
     EXCESS_COEFFICIENT = 100
+    _ASSUMPTIONS = None  # assumptions parsed from CalculatorFiles/Assumptions, keyed by their symbol
 
     # ===================================================================================================== CONSTRUCTORS
     def __init__(self, *args, **kwargs):
@@ -75,7 +77,7 @@ class ReactionCalculator:
             self._init_from_reaction(args[0])
         elif len(args) == 1 and isinstance(args[0], str):
             self._init_from_string(args[0])
-        elif len(args) > 1 and all([isinstance(arg, (Molecule, Simple)) for arg in args]):
+        elif len(args) > 1 and all(isinstance(arg, (Molecule, Simple)) for arg in args):
             self._init_from_reagents(args)
         elif len(kwargs) == 2 and 'reagents' in kwargs and 'products' in kwargs:
             self._init_from_substances(rs=kwargs['reagents'], ps=kwargs['products'])
@@ -135,15 +137,32 @@ class ReactionCalculator:
 
         raise TypeError(f'Wrong substance data type: expected "str", "Molecule" or "Simple", got "{type(substance)}"')
 
+    @classmethod
+    def _read_assumptions(cls) -> Dict[str, Assumption]:
+        """
+        The assumptions file does not change while the program runs, so it is parsed only once and the result is
+        shared by all the instances. Use reload_assumptions() if the file was edited.
+        """
+
+        if cls._ASSUMPTIONS is None:
+            cls._ASSUMPTIONS = {a.symbol: a for a in cls._parse_assumptions()}
+        return cls._ASSUMPTIONS
+
     @staticmethod
-    def _read_assumptions() -> Generator[Assumption, None, Assumption]:
+    def _parse_assumptions() -> Generator[Assumption, None, Assumption]:
         file = File(__file__)
         file.bind('CalculatorFiles/Assumptions')
 
+        # the keyword a line starts with defines which method of Assumption receives the Datum written after it
+        keywords = {
+            'variable': Assumption.to_set,
+            'compute': Assumption.to_compute,
+            'assume': Assumption.to_assume,
+        }
         assumption = None
 
         for line in file.read_all():
-            if line.startswith('#'):
+            if not line or line.startswith('#'):
                 continue
             elif line == '!':
                 if assumption is not None:
@@ -152,25 +171,19 @@ class ReactionCalculator:
                     raise IncorrectFileFormatting(file_name=file.name, variables=locals())
                 assumption = None
             elif line.startswith('!'):
-                symbol, name = line.split(':')
+                symbol, _, name = line.partition(':')
                 symbol = symbol.strip('!').strip(' ')
                 name = name.strip(' ')
                 assumption = Assumption(symbol, name)
-            elif line.startswith('variable'):
-                a, b = line.split(' ')
-                symbol, value, unit = b.split(':')
-                d = Datum(symbol, float(value), unit)
-                assumption.to_set(d)
-            elif line.startswith('compute'):
-                a, b = line.split(' ')
-                var, units = b.split('::')
-                assumption.to_compute(Datum(var, 0, units))
-            elif line.startswith('assume'):
-                a, b = line.split(' ')
-                var, value, units = b.split(':')
-                assumption.to_assume(Datum(var, float(value), units))
-            elif line.isalnum():
-                raise IncorrectFileFormatting(file_name=file.name, variables=locals())
+            else:
+                keyword, _, datum = line.partition(' ')
+                add_to_assumption = keywords.get(keyword)
+
+                if add_to_assumption is None or assumption is None:
+                    raise IncorrectFileFormatting(file_name=file.name, variables=locals())
+
+                symbol, value, unit = datum.split(':')  # value is empty for "compute" lines
+                add_to_assumption(assumption, Datum(symbol, float(value) if value else 0, unit))
 
         if assumption is not None:
             return assumption
@@ -220,13 +233,18 @@ class ReactionCalculator:
         return self._substance_data[sub]
 
     def assume(self, *assumptions: str) -> None:
-        read_assumptions = [a for a in self._read_assumptions()]
+        read_assumptions = self._read_assumptions()
 
-        for a in read_assumptions:
-            if a.symbol in assumptions:
+        for symbol in assumptions:
+            a = read_assumptions.get(symbol)
+            if a is not None:
                 for li in self.calculators:
                     a.apply_to(li)
 
+    @classmethod
+    def reload_assumptions(cls) -> None:
+        cls._ASSUMPTIONS = None
+
     def write(self, *data: SSDatum) -> None:
         for datum in data:
             sub = datum.substance
@@ -409,10 +427,13 @@ class ReactionCalculator:
 
         for var in variables:
             sub = var.substance
-            self.substance(sub).target = var.datum
+            calculator = self.substance(sub)
+            calculator.target = var.datum
             try:
-                self.substance(sub).solve(stop_at_target=True, alter_target=True)
-                result = self.substance(sub).target.to(var.unit)
+                calculator.solve(stop_at_target=True, alter_target=True)
+                target = calculator.target
+                # the target usually already has the requested units, then there is nothing to convert
+                result = target if target.unit == var.unit else target.to(var.unit)
 
                 if rounding:
                     magnitude = round(result.value, var.num_decimals)
@@ -422,7 +443,7 @@ class ReactionCalculator:
                 ret_list.append(SSDatum(sub, result.symbol, magnitude, result.unit))
 
             except SolutionNotFound:
-                raise ComputationException(self.substance(sub).target.symbol, substance=sub.formula(), variables=locals())
+                raise ComputationException(calculator.target.symbol, substance=sub.formula(), variables=locals())
 
         return ret_list
 
@@ -2,17 +2,26 @@ from __future__ import annotations
 from miniChemistry.Core.Substances import Molecule, Simple
 from QCalculator import Datum
 
+from functools import lru_cache
 from typing import Union
 from pint import Unit
 
 
+@lru_cache(maxsize=256)
+def _unit_cache(units: str) -> Unit:
+    """Parsing a unit string with pint is expensive and the set of units used here is small, so parse each once."""
+    return Unit(units)
+
+
 class SSDatum(Datum):
     """
     SSDatum stands for "Substance–Specific Datum". This class extends the Datum class by adding a substance as another
     data point. The constructor then takes in an additional parameter ("substance", which will always go the first one).
     """
 
-    
+    # only the substance is added on top of Datum; with a slotted Datum this keeps SSDatum instances dict-free
+    __slots__ = ('_substance',)
+
     def __init__(self,
                  substance: Union[Molecule, Simple],
                  variable: str,
@@ -20,10 +29,12 @@ class SSDatum(Datum):
                  units: Union[str, Unit] = 'dimensionless') -> None:
 
         self._substance = substance
+        units = _unit_cache(units) if isinstance(units, str) else units
         super().__init__(variable, value, units)
 
     def __eq__(self, other: SSDatum):
-        return self.datum == other.datum and self.substance == other.substance
+        # substances are compared first: it is much cheaper than building two Data and reducing their units
+        return self.substance == other.substance and self.datum == other.datum
 
     def __getitem__(self, item):
         item_list = [self.substance, *self.datum, str(self.datum.unit)]
@@ -13,7 +13,10 @@ units_file = File(__file__)
 units_file.bind('CalculatorFiles/units_and_names.txt')
 
 for line in units_file.read_all():
-    symbol, name, unit, default = line.split(':')
+    # symbol:name:unit:default – the name is the only free-text field, so it is the one allowed to contain colons
+    symbol, _, line = line.partition(':')
+    line, _, default = line.rpartition(':')
+    name, _, unit = line.rpartition(':')
 
     if not default == 'None':
         default = float(default)
@@ -335,7 +335,7 @@ class MetalActivitySeries:
             return 'unknown'
         elif all(active_if):
             return 'active'
-        elif any([all(conditions) for conditions in middle_active_if]):
+        elif any(all(conditions) for conditions in middle_active_if):
             return 'middle active'
         elif all(inactive_if):
             return 'inactive'
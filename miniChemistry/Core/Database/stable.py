@@ -56,14 +56,24 @@ You can use self.cursor and self.connect to operate the database directly.
 """
 
 
+from itertools import chain
 from typing import Iterable, List
 from miniChemistry.Utilities.Checks import keywords_check, type_check
 from miniChemistry.Core.CoreExceptions.stableExceptions import *
 import os
+import numpy as np
 import pandas as pd
 from miniChemistry.Core.Database.ptable import * # needed for sorting by atom number when saving the file with self.end
 
 
+# column types of SolubilityTable.csv; given explicitly so that pandas does not have to infer them on every load
+# (charges are within -4..+8, so int8 is enough)
+_DTYPES = {'cation': 'string', 'cation_charge': 'int8', 'anion': 'string', 'anion_charge': 'int8', 'solubility': 'category'}
+
+# used to sort the table by the cation's atomic number in SolubilityTable.commit()
+_ATOMIC_NUMBERS = {element.symbol: element.atomic_number for element in TABLE}
+
+
 class SolubilityTable:
     """
     The SolubilityTable class should store information about solubility of a substance and and the same time the
@@ -76,7 +86,8 @@ class SolubilityTable:
     The formulas and the solubility are TEXT, but the charges are INTEGER.
 
     To make it easier to return the result, two named tuples are used: Substance and Ion. You can see below that
-    Substance consists of the first four items – cation, cation charge, anion and anion charge.
+    Substance consists of all five items – cation, cation charge, anion, anion charge and solubility (the rows of the
+    table are returned as Substance instances).
     An Ion consists of two other items – composition and charge (composition is just another name for formula).
     As a result, you can address the returned values of the SolubilityTable class as
 
@@ -93,9 +104,22 @@ class SolubilityTable:
 
     Substance = namedtuple(
         'Substance',
-        'cation, cation_charge, anion, anion_charge'
+        'cation, cation_charge, anion, anion_charge, solubility'
     )
 
+    # columns that hold formulas and solubilities (strings) and charges (integers) respectively
+    _TEXT_FIELDS = ('cation', 'anion', 'solubility')
+    _CHARGE_FIELDS = ('cation_charge', 'anion_charge')
+    # The five allowed solubility states.
+    _SOLUBILITY_OPTIONS = frozenset({'SL', 'SS', 'NS', 'RW', 'ND'})
+    # the fields that identify a substance
+    _KEY_FIELDS = frozenset({'cation', 'cation_charge', 'anion', 'anion_charge'})
+    # keywords accepted by select_ion (select_substance accepts the fields of Substance) and the allowed argument types
+    _ION_KEYWORDS = ('cation', 'anion', 'charge')
+    _ARGUMENT_TYPES = (str, int)
+    # how many select_ion/select_substance results are remembered by a single table
+    _QUERY_CACHE_SIZE = 256
+
 
     def __init__(self):
 
@@ -106,23 +130,111 @@ class SolubilityTable:
         # Only used in `begin():self._connect`.
         _cwd = os.path.dirname(os.path.abspath(__file__))
         self._dbpath = os.path.join(_cwd, 'SolubilityTable.csv')
-        self.data = pd.read_csv(self._dbpath,index_col=False)
+        self.data = pd.read_csv(self._dbpath, index_col=False, dtype=_DTYPES, engine='c')
+        self._pending = []  # rows added by write(), moved into self.data all at once by _flush()
+        self._rows_cache = None  # tuple of Substance rows, built on first iteration, reset when the table changes
+        self._columns_cache = None  # every column as a numpy array, in the same order as the rows
+        self._keys_cache = None  # (cation, cation_charge, anion, anion_charge) -> positions of the matching rows
+        self._ions_cache = None  # distinct cations and anions of the table as two tuples of Ion
+        self._ion_sets_cache = None  # frozenset of each of these ions, in the same order
+        self._queries_cache = dict()  # results of the previous select_ion/select_substance calls
+        _warn_if_empty(self)
 
     def commit(self):
         """Commit changes to the SolubilityTable csv database"""
+        self._flush()
         self.data.sort_values(
             by="cation",
-            key=lambda series:pd.Series(map(lambda element:eval(element)._atomic_number,series)),
+            key=lambda series: series.map(_ATOMIC_NUMBERS),
             inplace=True
         )
+        self._clear_caches()  # the rows were reordered
         self.data.to_csv(self._dbpath,index=False)
 
     def __iter__(self) -> Iterable:
         """
-        Returns the solubility table as an iterable.
+        Returns the solubility table as an iterable. The rows are converted to Substance instances only once and
+        reused until the table is changed by write().
         :return:
         """
-        return self.data.itertuples(name="Substance",index=False)
+        return iter(self._rows())
+
+    def _flush(self) -> None:
+        """
+        Appending to a DataFrame row by row copies it every time, so write() only collects the new rows. They are
+        added to self.data in one go here, before the table is read or saved.
+        """
+        if self._pending:
+            new_rows = pd.DataFrame(self._pending, columns=self.data.columns)
+            self.data = pd.concat([self.data, new_rows], ignore_index=True)
+            self._pending = []
+
+            keys = self._keys_cache  # write() keeps the key index up to date, so it survives the flush
+            self._clear_caches()
+            self._keys_cache = keys
+
+    def _rows(self) -> tuple:
+        self._flush()
+        if self._rows_cache is None:
+            # column-wise .tolist() gives plain Python str/int, unlike to_numpy() on mixed columns
+            columns = (self.data[field].tolist() for field in SolubilityTable.Substance._fields)
+            self._rows_cache = tuple(SolubilityTable.Substance(*row) for row in zip(*columns))
+        return self._rows_cache
+
+    def _columns(self) -> dict:
+        self._flush()
+        if self._columns_cache is None:
+            self._columns_cache = {field: self.data[field].to_numpy() for field in SolubilityTable.Substance._fields}
+        return self._columns_cache
+
+    def _keys(self) -> dict:
+        if self._keys_cache is None:
+            self._keys_cache = dict()
+            for position, row in enumerate(self._rows()):
+                self._keys_cache.setdefault(row[:4], []).append(position)
+        return self._keys_cache
+
+    def _ions(self) -> tuple:
+        self._flush()
+        if self._ions_cache is None:
+            rows = self._rows()
+            # dict.fromkeys drops the repeated ions but keeps the order of the table
+            cations = dict.fromkeys(SolubilityTable.Ion(s.cation, s.cation_charge) for s in rows)
+            anions = dict.fromkeys(SolubilityTable.Ion(s.anion, s.anion_charge) for s in rows)
+            self._ions_cache = (tuple(cations), tuple(anions))
+        return self._ions_cache
+
+    def _ion_sets(self) -> tuple:
+        self._flush()
+        if self._ion_sets_cache is None:
+            cations, anions = self._ions()
+            self._ion_sets_cache = (tuple(map(frozenset, cations)), tuple(map(frozenset, anions)))
+        return self._ion_sets_cache
+
+    def _clear_caches(self) -> None:
+        self._rows_cache = None
+        self._columns_cache = None
+        self._keys_cache = None
+        self._ions_cache = None
+        self._ion_sets_cache = None
+        self._queries_cache = dict()
+
+    def _remember(self, query: tuple, result: Iterable) -> list:
+        """Stores the result of a query (oldest first out) and returns it as a list."""
+        result = list(result)
+        if len(self._queries_cache) >= SolubilityTable._QUERY_CACHE_SIZE:
+            del self._queries_cache[next(iter(self._queries_cache))]
+        self._queries_cache[query] = tuple(result)
+        return result
+
+    def is_empty(self) -> bool:
+        """
+        Checks whether the solubility table contains any substances. Unlike len(self.select_substance()) this does not
+        build the list of all substances.
+        :return: True if the table has no rows
+        """
+        self._flush()
+        return self.data.empty
 
     def write(self, cation: str, cation_charge: int, anion: str, anion_charge: int, solubility: str) -> None:
         """
@@ -132,24 +244,27 @@ class SolubilityTable:
         :param cation_charge: positive int
         :param anion: str
         :param anion_charge: negative int
-        :param solubility: str (one of the five strings mentioned in the self._solubility_options)
+        :param solubility: str (one of the five strings mentioned in the SolubilityTable._SOLUBILITY_OPTIONS)
         :return: None
         """
 
-        # The five allowed solubility states.
-        self._solubility_options = ('SL', 'SS', 'NS', 'RW', 'ND')
-        # check that the solubility mentioned is actually one of the five allowed
-        keywords_check([solubility], self._solubility_options, 'SolubilityTable.write', variables=locals())
+        # check that the solubility mentioned is actually one of the five allowed (keywords_check raises the exception)
+        if solubility not in SolubilityTable._SOLUBILITY_OPTIONS:
+            keywords_check([solubility], SolubilityTable._SOLUBILITY_OPTIONS, 'SolubilityTable.write', variables=locals())
 
         rowToAdd = (cation, cation_charge, anion, anion_charge, solubility)
+        key = rowToAdd[:4]
+        keys = self._keys()
 
-        if rowToAdd in self.data.loc:
+        if key in keys:
             # if got something, then raise an exception
             sap = SubstanceAlreadyPresent(substance_signature=[cation, cation_charge, anion, anion_charge], variables=locals())
             raise sap
         else:
-            self.data.loc[len(self.data)] = rowToAdd
-            self.data.drop_duplicates()
+            self._pending.append(rowToAdd)
+            # the key index is kept up to date instead of being rebuilt, so that many writes in a row stay cheap
+            keys[key] = [len(self.data) + len(self._pending) - 1]
+            self._queries_cache.clear()
 
     def erase(self, cation: str, cation_charge: int, anion: str, anion_charge: int, solubility: str) -> None:
         pass
@@ -192,16 +307,11 @@ class SolubilityTable:
         the conditions will also be {'Na', 1}. So, yes, the function first does not distinguish between cations and
         anions, it just collects the formulas and charges from the arguments.
 
-        Then, the function iterated over the database (see __iter__ method and the line 'for substance in self' in this
-        function) and checks whether the substance (not the ion!) meets the requirements. The check is done as follows:
-
-        We have a set of conditions, for example {'Na', 1} and we have a substance, for example Na2SO4 with Na(+) and
-        SO4(-2) ions, which is then converted into a set {'Na', 1, 'SO4', -2}. We accept the substance only in ALL the
-        conditions were satisfied (if the condition set is a subset of the substance set).
-
-        In this case we decompose the substance into its ions – cation and anion by using dot notation (remember that
-        the substance is a namedtuple). We then check if conditions set is a subset of the ion sets (i.e. if the ions
-        fulfill the conditions set).
+        Then, the function goes through the ions of the database. Each substance is decomposed into its ions – cation
+        and anion (for example, Na2SO4 gives two ions {'Na', 1} and {'SO4', -2}), and since the same ion is met in many
+        substances, the distinct ions are collected once and reused (see self._ions()). An ion is accepted only if ALL
+        the conditions are satisfied (if the conditions set is a subset of the ion set). Since an ion is a part of the
+        substance, there is no need to check the substance as a whole first.
 
         Finally, we eliminate all the negatively or positively charged ions depending on the keyword argument used. If
         the keyword 'cation' was used, the function must return only positive ions, if keyword 'anion' was used, then
@@ -211,10 +321,20 @@ class SolubilityTable:
         :param kwargs: 'cation', 'anion' and 'charge' for customisation
         :return: list of SolubilityTable.Ion instances
         """
-        type_check([*args, *kwargs.values()], [str, int], raise_exception=True)
-        keywords_check([*kwargs.keys()], ['cation', 'anion', 'charge'],
+        if not args and not kwargs:
+            # no constraints, so every ion of the table is returned without checking anything
+            cations, anions = self._ions()
+            return list(cations + anions)
+
+        type_check(chain(args, kwargs.values()), SolubilityTable._ARGUMENT_TYPES, raise_exception=True)
+        keywords_check(kwargs, SolubilityTable._ION_KEYWORDS,
                        function_name='SolubilityTable.select_ion', variables=locals(), raise_exception=True)
 
+        # the result only depends on which arguments were given, not on their order
+        query = ('ion', frozenset(args), frozenset(kwargs.items()))
+        if query in self._queries_cache:
+            return list(self._queries_cache[query])
+
         # Join all the arguments, each of which is a `constraint`
         constraints = set(args).union( set(kwargs.values()) )
 
@@ -222,29 +342,28 @@ class SolubilityTable:
         # it is a set as to avoid duplicates.
         ions = set()
 
-        # The substance is a match if its properties contain all of our constraints.
-        isMatch = lambda substance : constraints.issubset(set(substance))
-        matchingSubstances = filter(isMatch, self)
+        # An ion is a match if its formula and charge contain all of our constraints.
+        isMatch = lambda ion_set : constraints.issubset(ion_set)
+
+        # with the 'cation' or 'anion' keyword only one side of each substance can be returned, so the other is skipped
+        check_cations = 'anion' not in kwargs
+        check_anions = 'cation' not in kwargs
 
-        for substance in matchingSubstances:
-            cation = {substance.cation, substance.cation_charge}
-            anion = {substance.anion, substance.anion_charge}
+        # each ion appears in many substances, so only the distinct ions of the table are checked
+        cations, anions = self._ions()
+        cation_sets, anion_sets = self._ion_sets()
 
-            if isMatch(cation):
-                ions.add(
-                    SolubilityTable.Ion(substance.cation, substance.cation_charge)
-                )
-            if isMatch(anion):
-                ions.add(
-                    SolubilityTable.Ion(substance.anion, substance.anion_charge)
-                )
+        if check_cations:
+            ions.update(ion for ion, ion_set in zip(cations, cation_sets) if isMatch(ion_set))
+        if check_anions:
+            ions.update(ion for ion, ion_set in zip(anions, anion_sets) if isMatch(ion_set))
 
         if 'cation' in kwargs:
-            return list(filter(lambda ion:ion.charge>0, ions))
+            ions = filter(lambda ion:ion.charge>0, ions)
         elif 'anion' in kwargs:
-            return list(filter(lambda ion:ion.charge<0, ions))
+            ions = filter(lambda ion:ion.charge<0, ions)
 
-        return list(ions)
+        return self._remember(query, ions)
 
     def select_substance(self, *args, **kwargs) -> List['SolubilityTable.Substance']:
         """
@@ -298,59 +417,59 @@ class SolubilityTable:
 
 
         IMPLEMENTATION
-        To select the substances, the function creates a list of conditions that can be evaluated to True of False and
-        feeds it into the all() function. The conditions are created separately for positional and keyword arguments.
-        For positional arguments the condition is mere 'argument in substance' for each argument in positional arguments.
-        In a but more Python way, it is
-
-        for substance in self:
-            for arg in args:
-                if arg in substance:
-                    return True
-                else:
-                    return False
+        The table is kept column by column as numpy arrays (see self._columns()), so instead of checking the substances
+        one by one, the function builds a boolean mask with one element per substance and narrows it down for each
+        argument:
 
-        or to make it a list of evaluative conditions
+        mask &= (cation == 'Na') | (anion == 'Na') | (solubility == 'Na')      # positional string argument
+        mask &= (cation_charge == 1) | (anion_charge == 1)                     # positional integer argument
+        mask &= (anion == 'SO4')                                               # keyword argument
 
-        for substance in self:
-            args_list = [arg in substance for arg in args]
+        A string can only be a formula or a solubility and an integer can only be a charge, so each positional argument
+        is compared only with the columns of its type. The substances left in the mask are then returned.
 
-        With the keyword arguments the conditions are created in the form of lambda functions. To evaluate them all
-        for a certain substance we use
+        :param args: string or integer that indicate formula or charge of an ion respectively
+        :param kwargs: cation, cation_charge, anion, anion_charge, solubility
+        :return: List[SolubilityTable.Substance]
+        """
 
-        for substance in self:
-            kwargs_list = [c(substance) for c in conditions]
+        if not args and not kwargs:
+            # no constraints, so the whole table is returned
+            return list(self._rows())
 
-        where conditions is a list of lambda functions defined as described above.
+        keywords_check(kwargs, SolubilityTable.Substance._fields, variables=locals(),
+                       function_name="SolubilityTable.select_substance", raise_exception=True)
+        type_check(chain(args, kwargs.values()), SolubilityTable._ARGUMENT_TYPES, raise_exception=True)
 
-        To combine all of this, we sum the two lists and pass the final list to the all() function to get
+        rows = self._rows()
 
-        for substance in self:
-            if all([arg in substance for arg in args] + [c(substance) for c in conditions]):
-                substances_to_return.append(substance)
+        if not args and SolubilityTable._KEY_FIELDS.issubset(kwargs):
+            # the substance is fully defined by its ions, so it can be looked up instead of searched for
+            key = tuple(kwargs[field] for field in SolubilityTable.Substance._fields[:4])
+            found = [rows[i] for i in self._keys().get(key, [])]
+            return [s for s in found if 'solubility' not in kwargs or s.solubility == kwargs['solubility']]
 
-        The function then just returns the 'substance_to_return' list.
+        query = ('substance', frozenset(args), frozenset(kwargs.items()))
+        if query in self._queries_cache:
+            return list(self._queries_cache[query])
 
-        :param args: string or integer that indicate formula or charge of an ion respectively
-        :param kwargs: cation, cation_charge, anion, anion_charge, solubility
-        :return: List[SolubilityTable.Substance]
-        """
+        columns = self._columns()
+        mask = np.ones(len(rows), dtype=bool)
 
-        keywords_check([*kwargs.values()], ['cation', 'cation_charge', 'anion',
-                                            'anion_charge', 'solubility'], variables=locals(),
-                       function_name="SolubilityTable.select_substance", raise_exception=True)
-        type_check([*args, *kwargs.values()], [str, int], raise_exception=True)
+        for arg in args:
+            fields = SolubilityTable._TEXT_FIELDS if isinstance(arg, str) else SolubilityTable._CHARGE_FIELDS
+            arg_mask = np.zeros(len(rows), dtype=bool)
+            for field in fields:
+                arg_mask |= columns[field] == arg
+            mask &= arg_mask
 
-        def isMatch(substance):
-            # only match the substances mentioned in args
-            condition1 = set(args).issubset(substance)
-            # count properties which do not match
-            discrepancies = sum([   eval(f"{substance}.{constraint}") != kwargs[constraint]
-                                    for constraint in kwargs ])
-            condition2 = not discrepancies # no discrepancies = match
-            return condition1 and condition2
+        for field, value in kwargs.items():
+            if isinstance(value, str) == (field in SolubilityTable._TEXT_FIELDS):
+                mask &= columns[field] == value
+            else:
+                mask[:] = False  # a formula is never equal to a charge and vice versa
 
-        return list(filter(isMatch, self))
+        return self._remember(query, (rows[i] for i in np.flatnonzero(mask)))
 
     def _erase_all(self, no_confirm: bool = False) -> bool:
         if not no_confirm:
@@ -378,13 +497,24 @@ class SolubilityTable:
 """
 
 
-st = SolubilityTable()
-length = len(st.select_substance())
+_empty_table_checked = False
 
-if length == 0:
-    print('WARNING: solubility table is empty. Run the following code:\n'
-          '>>> from miniChemistry.Core.Database.ModifySolubilityTable import modify\n'
-          '>>> modify(confirmation=False)\n'
-          'The code will require confirmation to overwrite the solubility table file.\n'
-          'After code execution the solubility table database should contain most common substances\n'
-          'met in school chemistry.')
+
+def _warn_if_empty(table: SolubilityTable) -> None:
+    """
+    Prints a warning if the solubility table is empty. Called from SolubilityTable.__init__ and does the check only
+    once per session, so importing this module does not read the database by itself.
+    """
+    global _empty_table_checked
+
+    if _empty_table_checked:
+        return
+    _empty_table_checked = True
+
+    if table.is_empty():
+        print('WARNING: solubility table is empty. Run the following code:\n'
+              '>>> from miniChemistry.Core.Database.ModifySolubilityTable import modify\n'
+              '>>> modify(confirmation=False)\n'
+              'The code will require confirmation to overwrite the solubility table file.\n'
+              'After code execution the solubility table database should contain most common substances\n'
+              'met in school chemistry.')
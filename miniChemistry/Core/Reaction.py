@@ -23,13 +23,14 @@ The Reaction class contains all the properties of a reaction that follow directl
 - equation
 - scheme (equation without coefficients)
 - coefficients (a dict with substances as keys and their coefficients as values)
-- substances (list of all substances)
+- substances (tuple of all substances)
 - reagents
 - products
 
 The class also has some magic methods implemented for easier handling of the reactions. Those are
 __hash__. Returns a hash of a reaction scheme, because a scheme (given that the module does not support isomers) is
 reaction's unique signature
+(the signature() method gives the same kind of hash, but one that does not change between Python sessions)
 __eq__. Compares reaction's schemes (for the same reason)
 __iter__. Iterates over reaction's substances
 __getitem__. Returns a substance. The indices are provided in the same order as reagents, plus products if they are given
@@ -37,6 +38,8 @@ __getitem__. Returns a substance. The indices are provided in the same order as
 
 
 from __future__ import annotations
+import re
+from hashlib import blake2b
 from typing import Union, Tuple, List
 from miniChemistry.Core.Substances import Molecule, Simple
 from miniChemistry.Utilities.Checks import type_check
@@ -47,6 +50,10 @@ from miniChemistry.Core.CoreExceptions.ReactionExceptions import WrongReactionCo
 from miniChemistry.MiniChemistryException import NotSupposedToHappen
 
 
+# reagents and products can be separated by either "->" or "="
+_SIDES_SEPARATOR = re.compile('->|=')
+
+
 class Reaction:
     IGNORE_RESTRICTIONS: bool = False
 
@@ -68,13 +75,13 @@ class Reaction:
         :param products: list of Simple and/or Molecule
         """
 
-        self._reagents = list()
-        self._products = list()
+        self._reagents = tuple()
+        self._products = tuple()
 
         if reagents is products is None and args:
             if 1 <= len(args) <= 2:
-                self._reagents = list(args)
-                self._products = list(predict(*args, ignore_restrictions=Reaction.IGNORE_RESTRICTIONS))
+                self._reagents = args
+                self._products = predict(*args, ignore_restrictions=Reaction.IGNORE_RESTRICTIONS)
             else:
                 raise WrongNumberOfReagents(reagents=[arg.formula() for arg in args], variables=locals())
         elif reagents and products and not args:
@@ -83,20 +90,43 @@ class Reaction:
         else:
             raise WrongReactionConstructorParameters(variables=locals())
 
-        self._reagents.sort(key=lambda s: s.formula())  # needed for conistent __eq__ and __hash__ work
-        self._products.sort(key=lambda s: s.formula())  # to make them insensitive to order of reagents
+        # sorted copies, so that the lists passed by the caller are not reordered; stored as tuples since
+        # the substances of a reaction never change after construction
+        self._reagents = tuple(sorted(self._reagents, key=lambda s: s.formula()))  # needed for conistent __eq__ and __hash__ work
+        self._products = tuple(sorted(self._products, key=lambda s: s.formula()))  # to make them insensitive to order of reagents
+        self._substances = self._reagents + self._products
+
+        self._coefficients = None  # reagents and products never change, so the reaction is equated only once
+        self._scheme = None  # same for the scheme, which is also used by __eq__ and __hash__
+        self._hash = None
+        self._signature = None
+        self._reaction_type = None
 
     def __iter__(self):
-        self.substances.__iter__()
+        return iter(self._substances)
 
     def __getitem__(self, item):
-        return self.substances[item]
+        return self._substances[item]
 
     def __eq__(self, other: Reaction):
         return self.scheme == other.scheme
 
     def __hash__(self):
-        return hash(self.scheme)
+        if self._hash is None:
+            self._hash = hash(self.scheme)
+        return self._hash
+
+    def signature(self) -> int:
+        """
+        Returns a 64-bit hash of the reaction scheme. Python's hash() of a string changes from one session to another,
+        while the signature stays the same, so it can be saved (for example, to a file) and compared later.
+        :return: integer, the first 8 bytes of the BLAKE2b digest of the scheme
+        """
+
+        if self._signature is None:
+            digest = blake2b(self.scheme.encode(), digest_size=8).digest()
+            self._signature = int.from_bytes(digest, 'big')
+        return self._signature
 
     def _get_scheme(self) -> str:
         """
@@ -104,10 +134,12 @@ class Reaction:
         :return: string, representing a reaction scheme
         """
 
-        scheme = ' + '.join([r.formula() for r in self.reagents])
-        scheme += ' -> '
-        scheme += ' + '.join([p.formula() for p in self.products])
-        return scheme
+        if self._scheme is None:
+            scheme = ' + '.join([r.formula() for r in self.reagents])
+            scheme += ' -> '
+            scheme += ' + '.join([p.formula() for p in self.products])
+            self._scheme = scheme
+        return self._scheme
 
     def _get_equation(self) -> str:
         """
@@ -116,23 +148,25 @@ class Reaction:
         :return: string, representing a reaction equation
         """
 
-        equation = ''
+        coefficients = self._get_coefficients()
 
-        for reagent in self.reagents:
-            coef = str(self.coefficients[reagent])
-            equation += coef if not coef == '1' else ''
-            equation += reagent.formula() + ' + '
-        equation = equation.strip(' + ')
+        def term(substance: Union[Simple, Molecule]) -> str:
+            coef = coefficients[substance]
+            return (str(coef) if coef != 1 else '') + substance.formula()
 
-        equation += ' = '
+        reagents = ' + '.join([term(r) for r in self.reagents])
+        products = ' + '.join([term(p) for p in self.products])
+        return reagents + ' = ' + products
 
-        for product in self.products:
-            coef = str(self.coefficients[product])
-            equation += coef if not coef == '1' else ''
-            equation += product.formula() + ' + '
-        equation = equation.strip(' + ')
+    def _get_coefficients(self) -> dict:
+        """
+        Equates the reaction with Equalizer on the first call and returns the same dict afterwards.
+        :return: dict with substances as keys and their coefficients as values
+        """
 
-        return equation
+        if self._coefficients is None:
+            self._coefficients = Equalizer(reagents=self.reagents, products=self.products).coefficients
+        return self._coefficients
 
     def _get_type(self) -> str:
         """
@@ -152,9 +186,9 @@ class Reaction:
             return 'addition'
         elif len(self.reagents) == 1 and len(self.products) > 1:
             return 'decomposition'
-        elif type_check([*self.reagents], [Molecule], raise_exception=False):
+        elif type_check(self.reagents, [Molecule], raise_exception=False):
             return 'exchange'
-        elif type_check([*self.reagents], [Simple, Molecule], raise_exception=False):
+        elif type_check(self.reagents, [Simple, Molecule], raise_exception=False):
             return 'substitution'
         else:
             nsth = NotSupposedToHappen(variables=locals())
@@ -172,14 +206,10 @@ class Reaction:
         """
 
         reaction = reaction.replace(' ', '')
-        reaction = reaction.replace('=', '->')  # does nothing if there is no '='
-        reagent_str, product_str = reaction.split("->")
-
-        reagents_str_split = reagent_str.split('+')
-        products_str_split = product_str.split('+')
+        reagent_str, product_str = _SIDES_SEPARATOR.split(reaction)
 
-        reagents = [parse(r) for r in reagents_str_split]
-        products = [parse(p) for p in products_str_split]
+        reagents = [parse(r) for r in reagent_str.split('+')]
+        products = [parse(p) for p in product_str.split('+')]
 
         return reagents, products
 
@@ -224,20 +254,20 @@ class Reaction:
         return self._get_equation()
 
     @property
-    def reagents(self):
+    def reagents(self) -> Tuple[Union[Simple, Molecule], ...]:
         return self._reagents
 
     @property
-    def products(self):
+    def products(self) -> Tuple[Union[Simple, Molecule], ...]:
         return self._products
 
     @property
-    def substances(self):
-        return self._reagents + (self.products if self.products is not None else [])
+    def substances(self) -> Tuple[Union[Simple, Molecule], ...]:
+        return self._substances
 
     @property
     def coefficients(self):
-        return Equalizer(reagents=self.reagents, products=self.products).coefficients
+        return dict(self._get_coefficients())  # a copy, so that the cached coefficients cannot be changed from outside
 
     @property
     def string_coefficients(self):
@@ -250,7 +280,7 @@ class Reaction:
 
         string_dict = dict()
 
-        for sub, coef in self.coefficients.items():
+        for sub, coef in self._get_coefficients().items():
             formula = sub.formula()
             string_dict.update({formula : coef})
 
@@ -258,4 +288,6 @@ class Reaction:
 
     @property
     def reaction_type(self) -> str:
-        return self._get_type()
+        if self._reaction_type is None:
+            self._reaction_type = self._get_type()
+        return self._reaction_type
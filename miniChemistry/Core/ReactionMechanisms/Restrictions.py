@@ -56,7 +56,7 @@ def _molecule_to_stable_substance(m: Molecule) -> SolubilityTable.Substance:
     anion_charge = m.anion.charge
 
     st = SolubilityTable()
-    molecules = st.select_substance(cation, cation_charge, anion, anion_charge)
+    molecules = st.select_substance(cation=cation, cation_charge=cation_charge, anion=anion, anion_charge=anion_charge)
 
     if len(molecules) > 1:
         nsth = NotSupposedToHappen(variables=locals())
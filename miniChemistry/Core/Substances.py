@@ -83,6 +83,7 @@ can make mistakes in complicated cases.
 
 # ==================================================================================================== IMPORT STATEMENTS
 
+from math import lcm
 from typing import Tuple, Dict, Union
 from chemparse import parse_formula
 from abc import ABC, abstractmethod
@@ -449,6 +450,7 @@ class Molecule(Particle):
     def __init__(self, cation: Ion, anion: Ion) -> None:
         self._cation = cation
         self._anion = anion
+        self._formula = None  # assembled on the first call of formula(), the ions of a molecule never change
         self._cation_index, self._anion_index = self._indices(cation, anion)
 
         charge_check([cation.charge*self._cation_index, anion.charge*self._anion_index],
@@ -485,8 +487,6 @@ class Molecule(Particle):
         :return: tuple of integers with cation's index first and anion's index second
         """
 
-        from math import lcm
-
         cation_charge = abs(cation.charge)
         anion_charge = abs(anion.charge)
 
@@ -557,13 +557,14 @@ class Molecule(Particle):
                                   f'normally is not possible.')
                 raise nsth
 
-        if self == Molecule.water:
-            return 'H2O'
+        if self._formula is not None:
+            return self._formula
 
-        formula = ''
-        formula += modification(self.cation, self._cation_index)
-        formula += modification(self.anion, self._anion_index)
-        return formula
+        if self == Molecule.water:
+            self._formula = 'H2O'
+        else:
+            self._formula = modification(self.cation, self._cation_index) + modification(self.anion, self._anion_index)
+        return self._formula
 
     @property
     def simple_class(self) -> str:
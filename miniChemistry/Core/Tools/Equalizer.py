@@ -76,7 +76,8 @@ class Equalizer:
     def __init__(self, *, reagents: list, products: list) -> None:
         self._reagents = reagents
         self._products = products
-        self._elements = tuple(self._elements(*self.reagents, *self.products))
+        # sorted by atomic number, so the rows of the matrix do not depend on the order of iteration over a set
+        self._elements = tuple(sorted(self._elements(*self.reagents, *self.products), key=lambda el: el.atomic_number))
         self._substances = tuple(self.reagents + self.products)
         self._matrix = self._create_matrix()
         self._substance_order = self._substances
@@ -85,10 +86,7 @@ class Equalizer:
 
     def _elements(self, *substances: Union[Simple, Molecule]) -> Set[pt.Element]:
         """Extracts all the elements present on the given substances"""
-        elements = set()
-        for substance in substances:
-            elements = elements.union(set(substance.elements))
-        return elements
+        return {element for substance in substances for element in substance.elements}
 
     def _create_matrix(self) -> Matrix:
         """
@@ -103,18 +101,14 @@ class Equalizer:
         :return:
         """
 
-        element_names = [element.symbol for element in self._elements]
-        substance_names = [sub.formula() for sub in self._substances]
-        matrix = []
-
-        for el_index, symbol in enumerate(element_names):
-            element = self._elements[el_index]
-            matrix.append([])
-            for sb_index, sub in enumerate(substance_names):
-                substance = self._substances[sb_index]
-                multiple = -1 if substance in self.products else 1
-                index = substance.composition.get(element)
-                matrix[el_index].append( multiple*(index if index is not None else 0) )
+        # reagents come first in self._substances, and the columns of products are negative. Molecule assembles its
+        # composition on every call, so the compositions are taken once per substance
+        signs = [1]*len(self.reagents) + [-1]*len(self.products)
+        compositions = [substance.composition for substance in self._substances]
+        matrix = [
+            [sign*composition.get(element, 0) for composition, sign in zip(compositions, signs)]
+            for element in self._elements
+        ]
 
         return Matrix(matrix)
 
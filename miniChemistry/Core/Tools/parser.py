@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, List, Union, Tuple
 from chemparse import parse_formula
 import miniChemistry.Core.Database.ptable as pt
@@ -281,6 +282,9 @@ def parse_complex_molecule(formula: str) -> Molecule:
 
 
 
+# the same formulas are parsed over and over (every reaction string goes through here), and both Simple and Molecule
+# never change after creation, so the parsed substances can be shared
+@lru_cache(maxsize=4096)
 def parse(formula: str) -> Union[Simple, Molecule]:
     string_composition = parse_formula(formula)
 
@@ -1,10 +1,9 @@
-from dataclasses import dataclass
+import ast
 from pathlib import Path
 from time import sleep
 
 
 # SETTINGS
-@dataclass
 class SETTINGS:
     SHOW_EXECUTION_TIME: bool = True
     READ_TIME: float = 0 # seconds
@@ -62,6 +61,10 @@ def comment(*texts, sep=' ', end='\n',
         sleep(SETTINGS.READ_TIME)
 
 
+# docstring and compiled code of the examples that were already run, so that repeated runs do not parse the file again
+_COMPILED_EXAMPLES = dict()
+
+
 def run_example(
                     file_name: str,
                     enter_after_doc: bool = True
@@ -72,15 +75,18 @@ def run_example(
     if not file.exists():
         raise Exception()
 
-    code = file.read_text()
-    doc = code.strip('"""').split('"""')[0]
+    if file not in _COMPILED_EXAMPLES:
+        code = file.read_bytes().decode('utf-8')
+        tree = ast.parse(code, filename=str(file))
+        _COMPILED_EXAMPLES[file] = (ast.get_docstring(tree) or '', compile(tree, str(file), 'exec'))
+    doc, compiled = _COMPILED_EXAMPLES[file]
 
     comment('The following exercise is solved in this example:\n', doc, '\n', no_delay=True)
 
     if enter_after_doc:
         input('Press "Enter" to continue >>> ')
     print(f'\n----- ====== RUNNING EXAMPLE {example_number} ====== ------')
-    exec(code)
+    exec(compiled, {'__name__': '__main__', '__file__': str(file)})
     print('\n----- ====== Done running the example code. ====== ------')
 
 